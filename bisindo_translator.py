@@ -7,6 +7,11 @@ import threading
 from collections import deque
 import tempfile
 import os
+import argparse
+import json
+
+from status_server import FrameStats, StatusServer
+from sesi_landmark import SessionRecorder
 
 TTS_ENGINE = None
 TTS_METHOD = "NONE"
@@ -57,14 +62,71 @@ hands = mp_hands.Hands(
     min_tracking_confidence=0.5
 )
 
+# Ambang jarak (koordinat ternormalisasi) dan sudut untuk deteksi alfabet
+AMBANG_DEFAULT = {
+    'jempol_telunjuk_c': 0.06,
+    'jempol_tengah_d': 0.05,
+    'jempol_telunjuk_f': 0.04,
+    'selisih_y_g': 0.03,
+    'selisih_y_h': 0.03,
+    'selisih_x_l': 0.08,
+    'rata_jarak_o': 0.06,
+    'telunjuk_tengah_r': 0.03,
+    'telunjuk_tengah_v': 0.04,
+    'sudut_telunjuk_x': 160,
+    'dua_telunjuk_dekat': 0.05,
+    'dua_pergelangan_dekat': 0.15,
+}
+
+MAX_TANGAN = 2
+DUA_TANGAN = "Dua"
+TANGAN_DOMINAN = {'kanan': "Right", 'kiri': "Left"}
+TIP_IDS = [4, 8, 12, 16, 20]
+
+def hitung_fitur(titik, kanan):
+    """Fitur tangan untuk array titik (tangan, 21, 2+) dan mask tangan kanan.
+
+    Jumlah tangan bebas, sehingga seluruh sesi rekaman bisa dihitung dalam
+    satu panggilan. Mengembalikan dict kolom dengan satu baris per tangan.
+    """
+    titik = titik[:, :, :2]
+    
+    # Jempol kanan terangkat ke kiri frame (sudah di-flip), jempol kiri ke kanan
+    jempol = np.where(kanan, titik[:, 4, 0] < titik[:, 3, 0], titik[:, 4, 0] > titik[:, 3, 0])
+    jari_lain = titik[:, TIP_IDS[1:], 1] < titik[:, [i - 2 for i in TIP_IDS[1:]], 1]
+    
+    def jarak(a, b):
+        return np.linalg.norm(titik[:, a] - titik[:, b], axis=1)
+    
+    v1 = titik[:, 6] - titik[:, 7]
+    v2 = titik[:, 8] - titik[:, 7]
+    cos_angle = np.sum(v1 * v2, axis=1) / (
+        np.linalg.norm(v1, axis=1) * np.linalg.norm(v2, axis=1) + 1e-6)
+    
+    return {
+        'jarak_jempol_telunjuk': jarak(4, 8),
+        'jarak_jempol_tengah': jarak(4, 12),
+        'jarak_telunjuk_tengah': jarak(8, 12),
+        'sudut_telunjuk': np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0))),
+        'jari': np.column_stack([jempol, jari_lain]).astype(int),
+    }
+
+def fitur_per_tangan(kolom):
+    """Ubah dict kolom hasil hitung_fitur menjadi list dict fitur per tangan"""
+    nilai = {key: array.tolist() for key, array in kolom.items()}
+    return [dict(zip(nilai, baris)) for baris in zip(*nilai.values())]
+
 class BISINDOTranslator:
     def __init__(self):
         self.current_gesture = "Tidak Ada"
-        self.last_gesture = "Tidak Ada"
-        self.stability_counter = 0
         self.stability_threshold = 8
         self.last_speak_time = 0
         self.speak_cooldown = 2.0
+        self.ambang = dict(AMBANG_DEFAULT)
+        
+        # Status penghalusan per tangan, dikunci dengan label handedness
+        self.status_tangan = {}
+        self.tangan_dominan = "Right"
         
         self.letter_buffer = deque(maxlen=20)
         self.word_buffer = []
@@ -77,13 +139,16 @@ class BISINDOTranslator:
         self.show_help = False
         
         self.temp_files = []
+        
+        # Sumber waktu; diganti jam simulasi saat replay sesi
+        self.clock = time.time
 
     def speak(self, text):
         if TTS_METHOD == "NONE":
             print(f"[SILENT] {text}")
             return
             
-        current_time = time.time()
+        current_time = self.clock()
         if current_time - self.last_speak_time > self.speak_cooldown:
             self.last_speak_time = current_time
             threading.Thread(target=self._speak_threaded, args=(text,), daemon=True).start()
@@ -131,39 +196,43 @@ class BISINDOTranslator:
     def hitung_jarak(self, p1, p2):
         return math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
 
-    def hitung_sudut(self, p1, p2, p3):
-        v1 = np.array([p1.x - p2.x, p1.y - p2.y])
-        v2 = np.array([p3.x - p2.x, p3.y - p2.y])
-        
-        cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2) + 1e-6)
-        angle = math.degrees(math.acos(np.clip(cos_angle, -1.0, 1.0)))
-        return angle
+    def label_tangan(self, handedness_list, jumlah):
+        """Label Left/Right per tangan; tangan tanpa label dianggap kanan lalu kiri"""
+        labels = []
+        for h in range(jumlah):
+            label = handedness_list[h] if handedness_list and h < len(handedness_list) else None
+            if label not in ("Left", "Right") or label in labels:
+                label = "Left" if "Right" in labels else "Right"
+            labels.append(label)
+        return labels
 
-    def deteksi_jari_terangkat(self, landmarks):
-        jari_terangkat = []
-        tip_ids = [4, 8, 12, 16, 20]
-        
-        if landmarks[tip_ids[0]].x < landmarks[tip_ids[0] - 1].x:
-            jari_terangkat.append(1)
-        else:
-            jari_terangkat.append(0)
-            
-        for i in range(1, 5):
-            if landmarks[tip_ids[i]].y < landmarks[tip_ids[i] - 2].y:
-                jari_terangkat.append(1)
-            else:
-                jari_terangkat.append(0)
-                
-        return jari_terangkat
+    def ekstrak_fitur(self, hand_landmarks_list, handedness_list=None):
+        """Hitung fitur semua tangan sekaligus dalam satu operasi NumPy.
+
+        Mengembalikan list (label, landmarks, fitur) per tangan. Fitur tidak
+        bergantung pada ambang sehingga bisa di-cache.
+        """
+        hand_landmarks_list = hand_landmarks_list[:MAX_TANGAN]
+        labels = self.label_tangan(handedness_list, len(hand_landmarks_list))
+        titik = np.array([[(lm.x, lm.y) for lm in hand] for hand in hand_landmarks_list])
+        kanan = np.array([label == "Right" for label in labels])
+        
+        fitur = fitur_per_tangan(hitung_fitur(titik, kanan))
+        return list(zip(labels, hand_landmarks_list, fitur))
 
-    def deteksi_alfabet_bisindo(self, landmarks, jari_terangkat):
+    def deteksi_jari_terangkat(self, landmarks, tangan="Right"):
+        return self.ekstrak_fitur([landmarks], [tangan])[0][2]['jari']
+
+    def deteksi_alfabet_bisindo(self, landmarks, jari_terangkat, fitur=None):
         jumlah_jari = sum(jari_terangkat)
         
-        jarak_jempol_telunjuk = self.hitung_jarak(landmarks[4], landmarks[8])
-        jarak_jempol_tengah = self.hitung_jarak(landmarks[4], landmarks[12])
-        jarak_telunjuk_tengah = self.hitung_jarak(landmarks[8], landmarks[12])
+        if fitur is None:
+            fitur = self.ekstrak_fitur([landmarks])[0][2]
+        jarak_jempol_telunjuk = fitur['jarak_jempol_telunjuk']
+        jarak_jempol_tengah = fitur['jarak_jempol_tengah']
+        jarak_telunjuk_tengah = fitur['jarak_telunjuk_tengah']
         
-        sudut_telunjuk = self.hitung_sudut(landmarks[6], landmarks[7], landmarks[8])
+        sudut_telunjuk = fitur['sudut_telunjuk']
         
         telunjuk_y = landmarks[8].y
         tengah_y = landmarks[12].y
@@ -177,25 +246,25 @@ class BISINDOTranslator:
             return "B"
             
         if jumlah_jari == 2 and jari_terangkat[0] == 1 and jari_terangkat[1] == 1:
-            if jarak_jempol_telunjuk > 0.06:
+            if jarak_jempol_telunjuk > self.ambang['jempol_telunjuk_c']:
                 return "C"
         
         if jumlah_jari == 1 and jari_terangkat[1] == 1:
-            if jarak_jempol_tengah < 0.05:
+            if jarak_jempol_tengah < self.ambang['jempol_tengah_d']:
                 return "D"
         
         if jumlah_jari == 0:
             return "E"
         
-        if jarak_jempol_telunjuk < 0.04 and jumlah_jari >= 3:
+        if jarak_jempol_telunjuk < self.ambang['jempol_telunjuk_f'] and jumlah_jari >= 3:
             return "F"
         
         if jumlah_jari == 2 and jari_terangkat[0] == 1 and jari_terangkat[1] == 1:
-            if abs(landmarks[4].y - landmarks[8].y) < 0.03:
+            if abs(landmarks[4].y - landmarks[8].y) < self.ambang['selisih_y_g']:
                 return "G"
         
         if jumlah_jari == 2 and jari_terangkat[1] == 1 and jari_terangkat[2] == 1:
-            if abs(telunjuk_y - tengah_y) < 0.03:
+            if abs(telunjuk_y - tengah_y) < self.ambang['selisih_y_h']:
                 return "H"
         
         if jumlah_jari == 1 and jari_terangkat[4] == 1:
@@ -205,7 +274,7 @@ class BISINDOTranslator:
             return "K"
         
         if jumlah_jari == 2 and jari_terangkat[0] == 1 and jari_terangkat[1] == 1:
-            if abs(landmarks[4].x - landmarks[8].x) > 0.08:
+            if abs(landmarks[4].x - landmarks[8].x) > self.ambang['selisih_x_l']:
                 return "L"
         
         if jumlah_jari == 0 and landmarks[4].y < landmarks[8].y:
@@ -216,7 +285,7 @@ class BISINDOTranslator:
         
         if jumlah_jari == 0:
             jarak_avg = (jarak_jempol_telunjuk + jarak_jempol_tengah) / 2
-            if jarak_avg < 0.06:
+            if jarak_avg < self.ambang['rata_jarak_o']:
                 return "O"
         
         if jumlah_jari == 2 and jari_terangkat[1] == 1 and jari_terangkat[2] == 1:
@@ -228,7 +297,7 @@ class BISINDOTranslator:
                 return "Q"
         
         if jumlah_jari == 2 and jari_terangkat[1] == 1 and jari_terangkat[2] == 1:
-            if jarak_telunjuk_tengah < 0.03:
+            if jarak_telunjuk_tengah < self.ambang['telunjuk_tengah_r']:
                 return "R"
         
         if jumlah_jari == 0:
@@ -242,14 +311,14 @@ class BISINDOTranslator:
             return "U"
         
         if jumlah_jari == 2 and jari_terangkat[1] == 1 and jari_terangkat[2] == 1:
-            if jarak_telunjuk_tengah > 0.04:
+            if jarak_telunjuk_tengah > self.ambang['telunjuk_tengah_v']:
                 return "V"
         
         if jumlah_jari == 3 and jari_terangkat[1] == 1 and jari_terangkat[2] == 1 and jari_terangkat[3] == 1:
             return "W"
         
         if jumlah_jari == 1 and jari_terangkat[1] == 1:
-            if sudut_telunjuk < 160:
+            if sudut_telunjuk < self.ambang['sudut_telunjuk_x']:
                 return "X"
         
         if jumlah_jari == 2 and jari_terangkat[0] == 1 and jari_terangkat[4] == 1:
@@ -283,45 +352,160 @@ class BISINDOTranslator:
         
         return "Tidak Dikenal"
 
-    def proses_frame(self, hand_landmarks_list):
+    def deteksi_dua_tangan(self, tangan):
+        """Isyarat dua tangan; None jika bukan isyarat dua tangan yang dikenal"""
+        (_, landmarks_a, fitur_a), (_, landmarks_b, fitur_b) = tangan
+        jari_a, jari_b = fitur_a['jari'], fitur_b['jari']
+        
+        if self.mode == "KATA":
+            if sum(jari_a) == 5 and sum(jari_b) == 5:
+                return "TERIMA KASIH"
+            
+            if jari_a[1:] == [1, 0, 0, 0] and jari_b[1:] == [1, 0, 0, 0]:
+                if self.hitung_jarak(landmarks_a[8], landmarks_b[8]) < self.ambang['dua_telunjuk_dekat']:
+                    return "TEMAN"
+            
+            if sum(jari_a) == 0 and sum(jari_b) == 0:
+                if self.hitung_jarak(landmarks_a[0], landmarks_b[0]) < self.ambang['dua_pergelangan_dekat']:
+                    return "KERJA"
+        
+        return None
+
+    def proses_frame(self, hand_landmarks_list, handedness_list=None):
         if not hand_landmarks_list:
+            self.proses_fitur([])
             return "Tidak Ada Tangan"
         
-        hand_landmarks = hand_landmarks_list[0]
-        jari_terangkat = self.deteksi_jari_terangkat(hand_landmarks)
-        
-        if self.mode == "ALFABET":
-            gesture = self.deteksi_alfabet_bisindo(hand_landmarks, jari_terangkat)
-        elif self.mode == "KATA":
-            gesture = self.deteksi_kata_bisindo(hand_landmarks, jari_terangkat)
-        else:
-            gesture = self.deteksi_alfabet_bisindo(hand_landmarks, jari_terangkat)
-
-        if gesture == self.last_gesture:
-            self.stability_counter += 1
-        else:
-            self.last_gesture = gesture
-            self.stability_counter = 0
-
-        if self.stability_counter >= self.stability_threshold:
-            if self.current_gesture != gesture:
-                self.current_gesture = gesture
-                current_time = time.time()
-                
-                if self.mode == "ALFABET" and gesture != "Tidak Dikenal":
-                    if len(gesture) == 1:
-                        self.letter_buffer.append(gesture)
-                        self.last_letter_time = current_time
-                        self.speak(gesture)
-                
-                elif self.mode == "KATA" and gesture != "Tidak Dikenal":
-                    self.word_buffer.append(gesture)
-                    self.speak(gesture)
-        
+        return self.proses_fitur(self.ekstrak_fitur(hand_landmarks_list, handedness_list))
+
+    def proses_fitur(self, tangan):
+        """Logika keputusan untuk fitur hasil ekstrak_fitur (list kosong jika tanpa tangan)"""
+        self.perbarui_tangan(self.klasifikasi_tangan(tangan))
+        gesture = self.gesture_stabil()
+        if gesture is not None:
+            self.komit_gesture(gesture)
         return self.current_gesture
 
+    def klasifikasi(self, hand_landmarks, jari_terangkat, fitur=None):
+        if self.mode == "KATA":
+            return self.deteksi_kata_bisindo(hand_landmarks, jari_terangkat)
+        return self.deteksi_alfabet_bisindo(hand_landmarks, jari_terangkat, fitur)
+
+    def klasifikasi_tangan(self, tangan):
+        """Gesture mentah per tangan, ditambah entri DUA_TANGAN jika ada isyarat dua tangan"""
+        gesture_tangan = {}
+        for label, landmarks, fitur in tangan:
+            gesture_tangan[label] = self.klasifikasi(landmarks, fitur['jari'], fitur)
+        
+        if len(tangan) == 2:
+            gesture = self.deteksi_dua_tangan(tangan)
+            if gesture is not None:
+                gesture_tangan[DUA_TANGAN] = gesture
+        return gesture_tangan
+
+    def perbarui_tangan(self, gesture_tangan):
+        """Penghalusan stabilitas terpisah untuk setiap tangan dan isyarat dua tangan.
+
+        Status yang hilang sesaat dipertahankan dan baru dibuang setelah hilang
+        lebih dari stability_threshold frame. Dict diganti utuh (bukan diubah
+        di tempat) agar aman dibaca thread server status.
+        """
+        status_baru = {}
+        for label, status in self.status_tangan.items():
+            if label not in gesture_tangan and status['hilang'] < self.stability_threshold:
+                status_baru[label] = dict(status, hilang=status['hilang'] + 1)
+        
+        for label, gesture in gesture_tangan.items():
+            status = dict(self.status_tangan.get(label) or {
+                'last_gesture': gesture, 'stability_counter': 0, 'current_gesture': "Tidak Ada"
+            })
+            status['hilang'] = 0
+            if gesture == status['last_gesture']:
+                status['stability_counter'] += 1
+            else:
+                status['last_gesture'] = gesture
+                status['stability_counter'] = 0
+            if status['stability_counter'] >= self.stability_threshold:
+                status['current_gesture'] = gesture
+            status_baru[label] = status
+        
+        self.status_tangan = status_baru
+
+    def gesture_stabil(self):
+        """Gesture stabil untuk dikomit: dua tangan, lalu tangan dominan, lalu tangan lain.
+
+        Tangan yang terlihat tetapi gesturnya belum stabil menahan komit (None)
+        agar gesture tangan berikutnya tidak ikut terkomit saat berganti huruf.
+        Tangan dominan yang hilang sesaat juga menahan komit; tangan lain baru
+        dipakai setelah status tangan dominan dibuang.
+        """
+        dua = self.status_tangan.get(DUA_TANGAN)
+        if dua is not None and dua['hilang'] == 0:
+            return self._gesture_jika_stabil(dua)
+        
+        dominan = self.status_tangan.get(self.tangan_dominan)
+        if dominan is not None:
+            return self._gesture_jika_stabil(dominan) if dominan['hilang'] == 0 else None
+        
+        lain = self.status_tangan.get("Left" if self.tangan_dominan == "Right" else "Right")
+        if lain is not None and lain['hilang'] == 0:
+            return self._gesture_jika_stabil(lain)
+        return None
+
+    def _gesture_jika_stabil(self, status):
+        if status['stability_counter'] >= self.stability_threshold:
+            return status['current_gesture']
+        return None
+
+    def komit_gesture(self, gesture):
+        if self.current_gesture == gesture:
+            return
+        self.current_gesture = gesture
+        current_time = self.clock()
+        
+        if self.mode == "ALFABET" and gesture != "Tidak Dikenal":
+            if len(gesture) == 1:
+                self.letter_buffer.append(gesture)
+                self.last_letter_time = current_time
+                self.speak(gesture)
+        
+        elif self.mode == "KATA" and gesture != "Tidak Dikenal":
+            self.word_buffer.append(gesture)
+            self.speak(gesture)
+
+    def tangan_terlihat(self):
+        """Gesture stabil per tangan yang terlihat pada frame terakhir"""
+        return {label: status['current_gesture']
+                for label, status in dict(self.status_tangan).items()
+                if status['hilang'] == 0}
+
+    def muat_config(self, path):
+        """Terapkan parameter dari file config JSON (mis. hasil tuning_parameter.py)"""
+        with open(path, 'r') as f:
+            config = json.load(f)
+        for key in ('stability_threshold', 'speak_cooldown', 'letter_timeout', 'word_timeout'):
+            if key in config:
+                setattr(self, key, config[key])
+        if 'tangan_dominan' in config:
+            tangan = TANGAN_DOMINAN.get(config['tangan_dominan'], config['tangan_dominan'])
+            if tangan not in ("Left", "Right"):
+                raise ValueError(f"tangan_dominan harus 'kanan' atau 'kiri', bukan {tangan!r}")
+            self.tangan_dominan = tangan
+        self.ambang.update(config.get('ambang', {}))
+        print(f"✓ Config dimuat dari {path}")
+
     def get_current_word(self):
         return ''.join(list(self.letter_buffer))
+
+    def get_status(self):
+        return {
+            'mode': self.mode,
+            'gesture': self.current_gesture,
+            'gesture_tangan': self.tangan_terlihat(),
+            'current_word': self.get_current_word(),
+            'word_buffer': list(self.word_buffer),
+            'tts': TTS_METHOD
+        }
     
     def clear_buffers(self):
         self.letter_buffer.clear()
@@ -331,13 +515,104 @@ class BISINDOTranslator:
     def __del__(self):
         self.cleanup_temp_files()
 
+def draw_interface(frame, translator, gesture_terdeteksi):
+    height, width = frame.shape[:2]
+
+    cv2.rectangle(frame, (0, 0), (width, 140), (0, 0, 0), -1)
+    
+    tts_color = (0, 255, 0) if TTS_METHOD != "NONE" else (0, 0, 255)
+    cv2.putText(frame, f'TTS: {TTS_METHOD}', (10, 25), 
+                cv2.FONT_HERSHEY_SIMPLEX, 0.6, tts_color, 1)
+    
+    cv2.putText(frame, f'MODE: {translator.mode}', (150, 25), 
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+    cv2.putText(frame, f'GESTURE: {gesture_terdeteksi}', (10, 65), 
+                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+    
+    if translator.mode == "ALFABET":
+        current_word = translator.get_current_word()
+        cv2.putText(frame, f'KATA: {current_word}', (10, 100), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
+    
+    gesture_tangan = translator.tangan_terlihat()
+    if len(gesture_tangan) > 1:
+        nama = {'Left': 'KIRI', 'Right': 'KANAN', DUA_TANGAN: 'DUA'}
+        per_tangan = "  ".join(f"{nama[label]}: {gesture}"
+                               for label, gesture in sorted(gesture_tangan.items()))
+        cv2.putText(frame, per_tangan, (10, 128), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+
+    cv2.putText(frame, "1:Alfabet 2:Kata C:Clear T:Test H:Help Q:Keluar", 
+                (10, height - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+
+    if translator.show_help:
+        help_text = [
+            "ALFABET BISINDO:",
+            "A=Jempol, B=4jari, C=JempolTelunjuk",
+            "D=Telunjuk+JempolTengah, E=Kepalan",
+            "F=OK, G=JempolTelunjukHorizontal",
+            "H=TelunjukTengahHorizontal, I=Kelingking",
+            "L=LShape, V=Peace, Y=JempolKelingking",
+            "",
+            "KATA DASAR:",
+            "5jari=HALO, Kepalan=YA, Telunjuk=TIDAK",
+            "2 TANGAN: 5+5=TERIMA KASIH, Telunjuk bertemu=TEMAN,",
+            "2 Kepalan berdekatan=KERJA",
+            f"",
+            f"Engine TTS: {TTS_METHOD}"
+        ]
+        
+        y_offset = 160
+        for i, text in enumerate(help_text):
+            cv2.putText(frame, text, (10, y_offset + i*20), 
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Penerjemah bahasa isyarat BISINDO")
+    parser.add_argument('--headless', action='store_true',
+                        help="Jalankan tanpa jendela cv2; status tersedia lewat server HTTP")
+    parser.add_argument('--serve', action='store_true',
+                        help="Jalankan server status HTTP bersama jendela cv2")
+    parser.add_argument('--port', type=int, default=8081, help="Port server status (localhost)")
+    parser.add_argument('--mode', choices=['alfabet', 'kata'], default='alfabet',
+                        help="Mode awal; satu-satunya cara memilih mode saat --headless")
+    parser.add_argument('--config', metavar='PATH',
+                        help="File config JSON berisi parameter stabilitas dan ambang")
+    parser.add_argument('--record', metavar='PATH',
+                        help="Rekam aliran landmark ke file sesi untuk diputar ulang")
+    parser.add_argument('--tangan-dominan', choices=list(TANGAN_DOMINAN), default=None,
+                        help="Tangan yang diutamakan saat kedua tangan berisyarat (default: kanan)")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("Error: Kamera tidak dapat dibuka.")
         return
 
     translator = BISINDOTranslator()
+    translator.mode = args.mode.upper()
+    if args.config:
+        translator.muat_config(args.config)
+    if args.tangan_dominan:
+        translator.tangan_dominan = TANGAN_DOMINAN[args.tangan_dominan]
+    stats = FrameStats()
+    
+    server = None
+    if args.headless or args.serve:
+        server = StatusServer(lambda: {
+            **translator.get_status(),
+            'stats': stats.as_dict()
+        }, port=args.port)
+        if not server.start():
+            if args.headless:
+                print("ERROR: Mode headless membutuhkan server status; program dihentikan.")
+                cap.release()
+                return
+            server = None
+    
+    recorder = SessionRecorder(args.record) if args.record else None
     
     if TTS_METHOD != "NONE":
         translator.speak("Penerjemah BISINDO siap digunakan")
@@ -354,6 +629,11 @@ def main():
     print("- Tekan 't' untuk test suara")
     print("- Tekan 'h' untuk bantuan")
     print("- Tekan 'q' untuk keluar")
+    if server is not None:
+        print(f"- Status JSON: http://127.0.0.1:{args.port}/status")
+        print(f"- Preview MJPEG: http://127.0.0.1:{args.port}/preview.mjpg")
+    if args.headless:
+        print("- Mode headless: tekan Ctrl+C untuk keluar")
     print("="*60)
 
     try:
@@ -363,64 +643,47 @@ def main():
                 continue
 
             frame = cv2.flip(frame, 1)
-            height, width, _ = frame.shape
+            stats.tick()
+            render = not args.headless or server.has_viewers()
             
             image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             results = hands.process(image_rgb)
             
-            gesture_terdeteksi = "Tidak Ada Tangan"
             hand_landmarks_list = []
+            handedness_list = []
 
             if results.multi_hand_landmarks:
                 for hand_landmarks in results.multi_hand_landmarks:
-                    mp_drawing.draw_landmarks(
-                        frame, hand_landmarks, mp_hands.HAND_CONNECTIONS,
-                        mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
-                        mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2)
-                    )
+                    if render:
+                        mp_drawing.draw_landmarks(
+                            frame, hand_landmarks, mp_hands.HAND_CONNECTIONS,
+                            mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2),
+                            mp_drawing.DrawingSpec(color=(255, 0, 0), thickness=2)
+                        )
                     hand_landmarks_list.append(hand_landmarks.landmark)
                 
-                gesture_terdeteksi = translator.proses_frame(hand_landmarks_list)
-
-            cv2.rectangle(frame, (0, 0), (width, 140), (0, 0, 0), -1)
-            
-            tts_color = (0, 255, 0) if TTS_METHOD != "NONE" else (0, 0, 255)
-            cv2.putText(frame, f'TTS: {TTS_METHOD}', (10, 25), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, tts_color, 1)
-            
-            cv2.putText(frame, f'MODE: {translator.mode}', (150, 25), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
-            cv2.putText(frame, f'GESTURE: {gesture_terdeteksi}', (10, 65), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-            
-            if translator.mode == "ALFABET":
-                current_word = translator.get_current_word()
-                cv2.putText(frame, f'KATA: {current_word}', (10, 100), 
-                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
-
-            cv2.putText(frame, "1:Alfabet 2:Kata C:Clear T:Test H:Help Q:Keluar", 
-                        (10, height - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-
-            if translator.show_help:
-                help_text = [
-                    "ALFABET BISINDO:",
-                    "A=Jempol, B=4jari, C=JempolTelunjuk",
-                    "D=Telunjuk+JempolTengah, E=Kepalan",
-                    "F=OK, G=JempolTelunjukHorizontal",
-                    "H=TelunjukTengahHorizontal, I=Kelingking",
-                    "L=LShape, V=Peace, Y=JempolKelingking",
-                    "",
-                    "KATA DASAR:",
-                    "5jari=HALO, Kepalan=YA, Telunjuk=TIDAK",
-                    f"",
-                    f"Engine TTS: {TTS_METHOD}"
-                ]
+                if results.multi_handedness:
+                    handedness_list = [h.classification[0].label for h in results.multi_handedness]
                 
-                y_offset = 160
-                for i, text in enumerate(help_text):
-                    cv2.putText(frame, text, (10, y_offset + i*20), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
+                stats.increment('hand_frames')
             
+            # Juga dipanggil tanpa tangan agar status per tangan ikut diperbarui
+            gesture_terdeteksi = translator.proses_frame(hand_landmarks_list, handedness_list)
+            
+            if recorder is not None:
+                recorder.add(hand_landmarks_list, handedness_list, translator.mode)
+
+            if args.headless:
+                # Gambar overlay hanya jika ada penonton preview
+                if render:
+                    draw_interface(frame, translator, gesture_terdeteksi)
+                    server.publish_frame(frame)
+                continue
+
+            draw_interface(frame, translator, gesture_terdeteksi)
+            if server is not None:
+                server.publish_frame(frame)
+
             cv2.imshow('Penerjemah BISINDO', frame)
 
             key = cv2.waitKey(5) & 0xFF
@@ -449,6 +712,10 @@ def main():
         print(f"Error: {e}")
     finally:
         translator.cleanup_temp_files()
+        if recorder is not None:
+            recorder.close()
+        if server is not None:
+            server.stop()
         cap.release()
         cv2.destroyAllWindows()
         if TTS_METHOD == "GTTS":
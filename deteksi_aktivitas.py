@@ -5,6 +5,13 @@ import threading
 from datetime import datetime
 import json
 import os
+import queue
+import argparse
+
+from status_server import FrameStats, StatusServer
+
+LOG_FILE = "seat_monitoring_log.json"
+CLIP_DIR = "./clips"
 
 try:
     import pyttsx3
@@ -19,8 +26,173 @@ except ImportError:
     TTS_ENGINE_AVAILABLE = False
     print("✗ Library pyttsx3 tidak ditemukan. Fitur suara tidak akan aktif.")
 
+def tambah_log(path, entry):
+    """Tambahkan satu entri ke log JSON (array) tanpa membaca ulang seluruh file"""
+    teks = "  " + json.dumps(entry, indent=2).replace("\n", "\n  ")
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        with open(path, 'w') as f:
+            f.write(f"[\n{teks}\n]")
+        return
+
+    with open(path, 'r+b') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 64))
+        ekor = f.read()
+        akhir = ekor.rstrip()
+        if not akhir.endswith(b"]"):
+            raise ValueError(f"{path} bukan array JSON")
+        isi = akhir[:-1].rstrip()
+        f.seek(size - len(ekor) + len(isi))
+        f.write((("\n" if isi.endswith(b"[") else ",\n") + teks + "\n]").encode("utf-8"))
+        f.truncate()
+
+class FrameRingBuffer:
+    """Ring buffer frame berukuran tetap, dialokasikan sekali sebagai satu blok NumPy"""
+    def __init__(self, capacity, frame_shape, dtype=np.uint8):
+        self.capacity = capacity
+        self.frame_shape = tuple(frame_shape)
+        self.frames = np.empty((capacity,) + self.frame_shape, dtype=dtype)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.write_index = 0
+        self.count = 0
+
+    def push(self, frame, timestamp):
+        """Salin frame ke slot berikutnya tanpa alokasi baru"""
+        slot = self.frames[self.write_index]
+        if frame.shape == self.frame_shape:
+            np.copyto(slot, frame)
+        else:
+            cv2.resize(frame, (self.frame_shape[1], self.frame_shape[0]), dst=slot,
+                       interpolation=cv2.INTER_AREA)
+        self.timestamps[self.write_index] = timestamp
+        self.write_index = (self.write_index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def snapshot(self, start_time, end_time):
+        """Salinan frame (urut waktu) dalam rentang [start_time, end_time]"""
+        order = (self.write_index - self.count + np.arange(self.count)) % self.capacity
+        ts = self.timestamps[order]
+        order = order[(ts >= start_time) & (ts <= end_time)]
+        return self.frames[order], self.timestamps[order]
+
+class EventClipRecorder:
+    """Simpan klip pendek di sekitar kejadian menggunakan thread encoder terpisah"""
+    def __init__(self, clip_dir=CLIP_DIR, pre_seconds=3.0, post_seconds=2.0,
+                 fps=None, scale=0.5, warmup_seconds=1.0, fps_margin=1.5):
+        self.clip_dir = clip_dir
+        self.pre_seconds = pre_seconds
+        self.post_seconds = post_seconds
+        self.fps = fps
+        self.scale = scale
+        self.warmup_seconds = warmup_seconds
+        self.fps_margin = fps_margin
+        self.capacity = None
+
+        self.warmup_times = []
+        self.buffer = None
+        # (clip_path, event_time, on_done); on_done(clip_path, error) dipanggil setelah
+        # klip selesai ditulis atau gagal
+        self.pending = []
+        self.jobs = queue.Queue()
+        self.encoder_thread = threading.Thread(target=self._encoder_loop, daemon=True)
+        self.encoder_thread.start()
+
+    def push(self, frame, timestamp=None):
+        """Masukkan frame ke ring buffer dan kirim klip yang sudah lengkap ke encoder"""
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self.buffer is None:
+            if self.fps is None:
+                # Ukur frame rate kamera dulu agar buffer benar-benar memuat pre+post detik
+                self.warmup_times.append(timestamp)
+                elapsed = timestamp - self.warmup_times[0]
+                if elapsed < self.warmup_seconds or len(self.warmup_times) < 2:
+                    return
+                self.fps = (len(self.warmup_times) - 1) / elapsed
+            self.capacity = int((self.pre_seconds + self.post_seconds) * self.fps * self.fps_margin) + 1
+            height, width = frame.shape[:2]
+            shape = (int(height * self.scale), int(width * self.scale)) + frame.shape[2:]
+            self.buffer = FrameRingBuffer(self.capacity, shape, dtype=frame.dtype)
+            print(f"[KLIP] Ring buffer {self.capacity} frame ({self.fps:.1f} fps)")
+
+        self.buffer.push(frame, timestamp)
+
+        while self.pending and timestamp >= self.pending[0][1] + self.post_seconds:
+            self._kirim(*self.pending.pop(0))
+
+    def _kirim(self, clip_path, event_time, on_done):
+        """Ambil frame klip dari ring buffer dan serahkan ke encoder"""
+        frames, timestamps = self.buffer.snapshot(
+            event_time - self.pre_seconds, event_time + self.post_seconds
+        )
+        if len(frames) > 0:
+            self.jobs.put((clip_path, frames, timestamps, on_done))
+        elif on_done is not None:
+            on_done(None, "tidak ada frame di sekitar kejadian")
+
+    def trigger(self, label, event_time=None, on_done=None):
+        """Jadwalkan klip untuk kejadian dan kembalikan path file-nya.
+
+        Path baru valid setelah on_done(clip_path, None) dipanggil; jika klip
+        gagal dibuat, on_done(None, pesan_error) dipanggil.
+        """
+        if event_time is None:
+            event_time = time.time()
+        stamp = datetime.fromtimestamp(event_time).strftime('%Y%m%d_%H%M%S_%f')
+        clip_path = os.path.join(self.clip_dir, f"{stamp}_{label}.mp4")
+        self.pending.append((clip_path, event_time, on_done))
+        return clip_path
+
+    def _encoder_loop(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            clip_path, frames, timestamps, on_done = job
+            try:
+                self._write_clip(clip_path, frames, timestamps)
+            except Exception as e:
+                print(f"[ERROR KLIP] {e}")
+                if on_done is not None:
+                    on_done(None, str(e))
+                continue
+            if on_done is not None:
+                on_done(clip_path, None)
+
+    def _write_clip(self, clip_path, frames, timestamps):
+        os.makedirs(os.path.dirname(clip_path), exist_ok=True)
+
+        fps = self.fps or 20
+        if len(timestamps) > 1 and timestamps[-1] > timestamps[0]:
+            fps = (len(timestamps) - 1) / (timestamps[-1] - timestamps[0])
+
+        height, width = frames.shape[1:3]
+        writer = cv2.VideoWriter(clip_path, cv2.VideoWriter_fourcc(*'mp4v'),
+                                 fps, (width, height))
+        if not writer.isOpened():
+            raise IOError(f"VideoWriter tidak dapat membuka {clip_path}")
+        for frame in frames:
+            writer.write(frame)
+        writer.release()
+        print(f"[KLIP] Disimpan: {clip_path}")
+
+    def stop(self):
+        """Tulis klip yang masih tertunda lalu hentikan thread encoder"""
+        for clip_path, event_time, on_done in self.pending:
+            if self.buffer is not None:
+                self._kirim(clip_path, event_time, on_done)
+            elif on_done is not None:
+                on_done(None, "ring buffer belum siap")
+        self.pending.clear()
+        self.jobs.put(None)
+        self.encoder_thread.join(timeout=10)
+        if self.encoder_thread.is_alive():
+            print("[KLIP] Encoder belum selesai; klip yang tersisa tidak dicatat di log")
+
 class SimpleSeatMonitor:
-    def __init__(self):
+    def __init__(self, log_file=LOG_FILE, rekam_klip=True):
 
         self.is_person_present = False
         self.last_detection_time = 0
@@ -30,6 +202,7 @@ class SimpleSeatMonitor:
         self.warning_delay = 5  
         self.last_warning_time = 0
         self.warning_cooldown = 3  
+        self.warning_clip_recorded = False
         
         # Pengaturan deteksi
         self.motion_threshold = 1000 
@@ -42,10 +215,71 @@ class SimpleSeatMonitor:
         
         # Status sistem
         self.monitoring_active = True
-        self.session_start = time.time()
+        self.clock = time.time
+        self.session_start = self.clock()
+        
+        # Perekaman klip kejadian
+        self.clip_recorder = EventClipRecorder() if rekam_klip else None
+        self.log_file = log_file
+        self.log_lock = threading.Lock()
         
         print("✓ Sistem monitor tempat duduk siap")
 
+    def muat_config(self, path):
+        """Terapkan parameter dari file config JSON (mis. hasil tuning_parameter.py)"""
+        with open(path, 'r') as f:
+            config = json.load(f)
+        for key in ('motion_threshold', 'stability_frames', 'warning_delay', 'warning_cooldown'):
+            if key in config:
+                setattr(self, key, config[key])
+        print(f"✓ Config dimuat dari {path}")
+
+    def record_frame(self, frame):
+        """Simpan frame ke ring buffer klip"""
+        if self.clip_recorder is not None:
+            self.clip_recorder.push(frame)
+
+    def log_event(self, activity, clip_label=None):
+        """Catat kejadian ke log JSON.
+
+        Klip dicatat sebagai entri terpisah oleh thread encoder setelah file
+        benar-benar ditulis (atau gagal), agar log tidak menunjuk file yang
+        tidak ada.
+        """
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'activity': activity,
+            'monitoring_active': self.monitoring_active
+        }
+        if clip_label is not None and self.clip_recorder is not None:
+            self.clip_recorder.trigger(
+                clip_label,
+                on_done=lambda clip_path, error: self.log_clip(entry, clip_path, error)
+            )
+        self.tulis_log(entry)
+
+    def log_clip(self, event_entry, clip_path, error):
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'activity': "Clip saved" if error is None else "Clip failed",
+            'event_timestamp': event_entry['timestamp'],
+            'event': event_entry['activity'],
+        }
+        if error is None:
+            entry['clip'] = clip_path
+        else:
+            entry['error'] = error
+        self.tulis_log(entry)
+
+    def tulis_log(self, entry):
+        if self.log_file is None:
+            return
+        try:
+            with self.log_lock:
+                tambah_log(self.log_file, entry)
+        except Exception as e:
+            print(f"[ERROR LOG] {e}")
+
     def speak_async(self, text):
         """Jalankan TTS secara asinkron"""
         def _speak():
@@ -79,7 +313,7 @@ class SimpleSeatMonitor:
 
     def update_presence(self, person_detected, motion_pixels):
         """Update status keberadaan dengan stabilitas"""
-        current_time = time.time()
+        current_time = self.clock()
         
         print(f"[DEBUG] Motion pixels: {motion_pixels}, Detected: {person_detected}, Present: {self.is_person_present}")
         
@@ -95,6 +329,7 @@ class SimpleSeatMonitor:
                     self.empty_start_time = None
                     self.last_detection_time = current_time
                     print("[INFO] Orang terdeteksi duduk")
+                    self.log_event("Person sat down")
                     self.speak_async("Selamat datang. Anda sedang dipantau.")
                 else:
                     self.last_detection_time = current_time
@@ -104,7 +339,9 @@ class SimpleSeatMonitor:
             if self.is_person_present:
                 self.is_person_present = False
                 self.empty_start_time = current_time
+                self.warning_clip_recorded = False
                 print(f"[INFO] Tempat duduk kosong pada {datetime.now().strftime('%H:%M:%S')}")
+                self.log_event("Person left seat", clip_label="kosong")
                 
             elif self.empty_start_time is not None:
 
@@ -124,11 +361,15 @@ class SimpleSeatMonitor:
             warning_msg = f"Peringatan! Tempat duduk kosong selama {seconds} detik. Mohon kembali ke tempat duduk sekarang!"
             
             print(f"[WARNING] {warning_msg}")
+            # Hanya peringatan pertama tiap episode kosong yang direkam sebagai klip
+            clip_label = None if self.warning_clip_recorded else "peringatan"
+            self.warning_clip_recorded = True
+            self.log_event(f"Seat empty warning ({seconds}s)", clip_label=clip_label)
             self.speak_async(warning_msg)
 
     def get_status(self):
         """Dapatkan status saat ini"""
-        current_time = time.time()
+        current_time = self.clock()
         
         if self.is_person_present:
             status = "ADA"
@@ -190,7 +431,19 @@ def draw_interface(frame, monitor, person_detected, motion_pixels):
     cv2.putText(frame, "T=Test, M=Toggle Monitor, Q=Keluar", 
                 (10, height-10), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sistem monitor tempat duduk")
+    parser.add_argument('--headless', action='store_true',
+                        help="Jalankan tanpa jendela cv2; status tersedia lewat server HTTP")
+    parser.add_argument('--serve', action='store_true',
+                        help="Jalankan server status HTTP bersama jendela cv2")
+    parser.add_argument('--port', type=int, default=8080, help="Port server status (localhost)")
+    parser.add_argument('--config', metavar='PATH',
+                        help="File config JSON berisi parameter deteksi dan peringatan")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     print("Memulai sistem monitor tempat duduk...")
 
     cap = cv2.VideoCapture(0)
@@ -199,15 +452,37 @@ def main():
         return
 
     monitor = SimpleSeatMonitor()
+    if args.config:
+        monitor.muat_config(args.config)
+    stats = FrameStats()
+    
+    server = None
+    if args.headless or args.serve:
+        server = StatusServer(lambda: {
+            **monitor.get_status(),
+            'monitoring_active': monitor.monitoring_active,
+            'stats': stats.as_dict()
+        }, port=args.port)
+        if not server.start():
+            if args.headless:
+                print("ERROR: Mode headless membutuhkan server status; program dihentikan.")
+                cap.release()
+                return
+            server = None
     
     print("\n" + "="*50)
     print("SISTEM MONITOR TEMPAT DUDUK")
     print("="*50)
     print("- Status ADA/KOSONG akan ditampilkan")
-    print("- Peringatan suara setelah 5 detik kosong")
+    print(f"- Peringatan suara setelah {monitor.warning_delay} detik kosong")
     print("- Tekan T untuk test suara")
     print("- Tekan M untuk toggle monitoring")
     print("- Tekan Q untuk keluar")
+    if server is not None:
+        print(f"- Status JSON: http://127.0.0.1:{args.port}/status")
+        print(f"- Preview MJPEG: http://127.0.0.1:{args.port}/preview.mjpg")
+    if args.headless:
+        print("- Mode headless: tekan Ctrl+C untuk keluar")
     print("="*50)
     
     # Pesan awal
@@ -224,13 +499,27 @@ def main():
             
             frame = cv2.flip(frame, 1)
             frame_count += 1
+            stats.tick()
+            
+            monitor.record_frame(frame)
        
             person_detected, motion_pixels, fg_mask = monitor.detect_motion_simple(frame)
             
      
             monitor.update_presence(person_detected, motion_pixels)
+            if person_detected:
+                stats.increment('motion_frames')
+
+            if args.headless:
+                # Gambar overlay hanya jika ada penonton preview
+                if server.has_viewers():
+                    draw_interface(frame, monitor, person_detected, motion_pixels)
+                    server.publish_frame(frame)
+                continue
 
             draw_interface(frame, monitor, person_detected, motion_pixels)
+            if server is not None:
+                server.publish_frame(frame)
             
    
             cv2.imshow('Monitor Tempat Duduk', frame)
@@ -267,6 +556,10 @@ def main():
     
     finally:
         # Cleanup
+        if monitor.clip_recorder is not None:
+            monitor.clip_recorder.stop()
+        if server is not None:
+            server.stop()
         cap.release()
         cv2.destroyAllWindows()
         print("Program selesai")
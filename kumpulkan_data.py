@@ -1,7 +1,9 @@
 import cv2
 import mediapipe as mp
+import numpy as np
 import os
 import pickle
+import argparse
 
 mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
@@ -9,44 +11,221 @@ mp_drawing = mp.solutions.drawing_utils
 hands = mp_hands.Hands(static_image_mode=True, max_num_hands=1, min_detection_confidence=0.5)
 
 DATA_DIR = './data_bisindo'
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
 
-
-JUMLAH_KELAS = 26 
+JUMLAH_KELAS = 26
 JUMLAH_SAMPEL = 100
 
-cap = cv2.VideoCapture(0)
+# Jarak minimum antar sampel dalam satu kelas
+JARAK_HASH = 6          # bit berbeda dari 64 bit dHash
+JARAK_LANDMARK = 0.05   # rata-rata jarak landmark setelah normalisasi
+
+# Batas frame yang dicoba per kelas agar perekaman tidak macet saat sampel terus ditolak
+MAKS_PERCOBAAN = JUMLAH_SAMPEL * 10
+
+HASH_SIZE = 8
+
+def hash_gambar(frame):
+    """dHash 64 bit: bandingkan piksel bertetangga pada citra abu-abu 9x8"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    kecil = cv2.resize(gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    return np.packbits(kecil[:, 1:] > kecil[:, :-1])
+
+def hash_landmark(frame):
+    """Vektor landmark tangan yang dinormalisasi terhadap pergelangan dan ukuran tangan"""
+    results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    if not results.multi_hand_landmarks:
+        return None
+    landmarks = results.multi_hand_landmarks[0].landmark
+    titik = np.array([[lm.x, lm.y, lm.z] for lm in landmarks], dtype=np.float32)
+    titik -= titik[0]
+    skala = np.linalg.norm(titik, axis=1).max()
+    if skala > 0:
+        titik /= skala
+    return titik.ravel()
+
+# Tabel popcount untuk jarak Hamming per byte
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+class IndeksKemiripan:
+    """Indeks per kelas untuk menolak sampel yang terlalu mirip dengan sampel tersimpan"""
+    def __init__(self, metode, jarak_min, kapasitas=256):
+        self.metode = metode
+        self.jarak_min = jarak_min
+        self.kapasitas = kapasitas
+        self.data = None
+        self.jumlah = 0
+
+    def jarak(self, h):
+        """Jarak dari h ke semua entri indeks, dihitung sekaligus"""
+        if self.jumlah == 0:
+            return np.empty(0)
+        data = self.data[:self.jumlah]
+        if self.metode == 'hash':
+            return POPCOUNT[np.bitwise_xor(data, h)].sum(axis=1)
+        return np.linalg.norm((data - h).reshape(self.jumlah, -1, 3), axis=2).mean(axis=1)
+
+    def duplikat(self, h):
+        jarak = self.jarak(h)
+        return jarak.size > 0 and jarak.min() < self.jarak_min
+
+    def tambah(self, h):
+        if self.data is None:
+            self.data = np.empty((self.kapasitas, h.size), dtype=h.dtype)
+        elif self.jumlah == len(self.data):
+            self.data = np.concatenate([self.data, np.empty_like(self.data)])
+        self.data[self.jumlah] = h
+        self.jumlah += 1
+
+    def coba_tambah(self, h):
+        """Tambahkan h jika bukan duplikat; kembalikan True jika ditambahkan"""
+        if self.duplikat(h):
+            return False
+        self.tambah(h)
+        return True
+
+def buat_indeks(metode, jarak=None):
+    if jarak is None:
+        jarak = JARAK_HASH if metode == 'hash' else JARAK_LANDMARK
+    return IndeksKemiripan(metode, jarak)
+
+def hitung_hash(frame, metode):
+    return hash_gambar(frame) if metode == 'hash' else hash_landmark(frame)
+
+def kumpulkan(metode, jarak):
+    cap = cv2.VideoCapture(0)
+    kurang = {}
+    berhenti = False
+
+    for j in range(JUMLAH_KELAS):
+        nama_kelas = chr(65 + j)
+
+        if not os.path.exists(os.path.join(DATA_DIR, nama_kelas)):
+            os.makedirs(os.path.join(DATA_DIR, nama_kelas))
 
-for j in range(JUMLAH_KELAS):
-    nama_kelas = chr(65 + j)
-    
-    if not os.path.exists(os.path.join(DATA_DIR, nama_kelas)):
-        os.makedirs(os.path.join(DATA_DIR, nama_kelas))
+        print(f'Mengumpulkan data untuk kelas: {nama_kelas}')
 
-    print(f'Mengumpulkan data untuk kelas: {nama_kelas}')
+        while True:
+            ret, frame = cap.read()
+            frame = cv2.flip(frame, 1)
+            cv2.putText(frame, f'Siap? Tunjukkan huruf "{nama_kelas}". Tekan "S" untuk mulai!', (50, 50),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
+            cv2.imshow('frame', frame)
+            if cv2.waitKey(25) == ord('s'):
+                break
 
-    while True:
-        ret, frame = cap.read()
-        frame = cv2.flip(frame, 1)
-        cv2.putText(frame, f'Siap? Tunjukkan huruf "{nama_kelas}". Tekan "S" untuk mulai!', (50, 50), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
-        cv2.imshow('frame', frame)
-        if cv2.waitKey(25) == ord('s'):
+        indeks = buat_indeks(metode, jarak)
+        counter = 0
+        ditolak = 0
+        tanpa_tangan = 0
+        percobaan = 0
+        while counter < JUMLAH_SAMPEL and percobaan < MAKS_PERCOBAAN:
+            ret, frame = cap.read()
+            frame = cv2.flip(frame, 1)
+            percobaan += 1
+
+            h = hitung_hash(frame, metode)
+            if h is None:
+                tanpa_tangan += 1
+            elif indeks.coba_tambah(h):
+                cv2.imwrite(os.path.join(DATA_DIR, nama_kelas, f'{counter}.jpg'), frame)
+                counter += 1
+            else:
+                ditolak += 1
+
+            tampilan = frame.copy()
+            cv2.putText(tampilan, f'Merekam... {counter}/{JUMLAH_SAMPEL} (duplikat: {ditolak}, tanpa tangan: {tanpa_tangan})',
+                        (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+            cv2.putText(tampilan, 'N: kelas berikutnya, Q: selesai',
+                        (50, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1)
+            cv2.imshow('frame', tampilan)
+            key = cv2.waitKey(25)
+            if key == ord('n'):
+                break
+            if key == ord('q'):
+                berhenti = True
+                break
+
+        print(f'Kelas {nama_kelas}: {counter} sampel unik, {ditolak} duplikat dilewati, '
+              f'{tanpa_tangan} frame tanpa tangan dilewati')
+        if counter < JUMLAH_SAMPEL:
+            kurang[nama_kelas] = JUMLAH_SAMPEL - counter
+            print(f'  Kelas {nama_kelas} kurang {JUMLAH_SAMPEL - counter} sampel')
+        if berhenti:
             break
 
-    counter = 0
-    while counter < JUMLAH_SAMPEL:
-        ret, frame = cap.read()
-        frame = cv2.flip(frame, 1)
-        
-        cv2.putText(frame, f'Merekam... {counter}/{JUMLAH_SAMPEL}', (50, 50), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 255), 2)
-        cv2.imshow('frame', frame)
-        cv2.waitKey(25) 
-
-        cv2.imwrite(os.path.join(DATA_DIR, nama_kelas, f'{counter}.jpg'), frame)
-        counter += 1
-
-cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+    if kurang:
+        print('Kelas dengan sampel kurang: ' +
+              ', '.join(f'{k} ({n})' for k, n in kurang.items()))
+
+    cap.release()
+    cv2.destroyAllWindows()
+
+def dedupe_folder(metode, jarak, dry_run=False):
+    """Hapus sampel yang hampir identik dari folder data yang sudah ada.
+
+    Sampel tanpa tangan terdeteksi (metode landmark) tidak pernah dihapus,
+    hanya dilaporkan.
+    """
+    total_hapus = 0
+    total_tanpa_tangan = 0
+    for nama_kelas in sorted(os.listdir(DATA_DIR)):
+        folder = os.path.join(DATA_DIR, nama_kelas)
+        if not os.path.isdir(folder):
+            continue
+
+        files = [f for f in os.listdir(folder) if f.lower().endswith(('.jpg', '.jpeg', '.png'))]
+        files.sort(key=lambda f: (len(f), f))
+
+        indeks = buat_indeks(metode, jarak)
+        hapus = []
+        tanpa_tangan = []
+        for nama_file in files:
+            path = os.path.join(folder, nama_file)
+            frame = cv2.imread(path)
+            if frame is None:
+                continue
+            h = hitung_hash(frame, metode)
+            if h is None:
+                tanpa_tangan.append(path)
+            elif not indeks.coba_tambah(h):
+                hapus.append(path)
+
+        print(f'Kelas {nama_kelas}: {indeks.jumlah} unik, {len(hapus)} duplikat, '
+              f'{len(tanpa_tangan)} tanpa tangan (dipertahankan)')
+        for path in tanpa_tangan:
+            print(f'  tanpa tangan: {path}')
+        if not dry_run:
+            for path in hapus:
+                os.remove(path)
+        total_hapus += len(hapus)
+        total_tanpa_tangan += len(tanpa_tangan)
+
+    aksi = "akan dihapus" if dry_run else "dihapus"
+    print(f'Total {total_hapus} sampel duplikat {aksi}, '
+          f'{total_tanpa_tangan} sampel tanpa tangan tidak disentuh')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Pengumpulan data BISINDO dengan penolakan duplikat")
+    parser.add_argument('--metode', choices=['hash', 'landmark'], default='hash',
+                        help="hash: dHash citra, landmark: posisi landmark tangan")
+    parser.add_argument('--jarak', type=float, default=None,
+                        help="Jarak minimum antar sampel dalam satu kelas")
+    parser.add_argument('--dedupe', action='store_true',
+                        help="Pangkas duplikat pada folder data yang sudah ada, tanpa merekam")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Dengan --dedupe: hanya tampilkan jumlah duplikat")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    if not os.path.exists(DATA_DIR):
+        os.makedirs(DATA_DIR)
+
+    if args.dedupe:
+        dedupe_folder(args.metode, args.jarak, args.dry_run)
+    else:
+        kumpulkan(args.metode, args.jarak)
+
+if __name__ == "__main__":
+    main()
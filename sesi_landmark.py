@@ -0,0 +1,253 @@
+import argparse
+import io
+import os
+import time
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+MAGIC = b"BISLMK2\n"
+MAGIC_V1 = b"BISLMK1\n"
+MAX_TANGAN = 2
+JUMLAH_LANDMARK = 21
+
+MODE_KODE = {"ALFABET": 0, "KATA": 1}
+KODE_MODE = {v: k for k, v in MODE_KODE.items()}
+
+# Handedness: -1 tidak ada, 0 kiri, 1 kanan
+HANDEDNESS_KODE = {"Left": 0, "Right": 1}
+KODE_HANDEDNESS = {v: k for k, v in HANDEDNESS_KODE.items()}
+
+Titik = namedtuple("Titik", "x y z")
+
+class SessionRecorder:
+    """Rekam aliran landmark mentah ke file biner ringkas.
+
+    Setiap chunk disimpan terkompresi zlib dan hanya berisi tangan yang
+    terlihat (float16), bukan slot tangan kedua yang kosong.
+    """
+    def __init__(self, path, chunk_size=256):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+
+        self.timestamps = np.zeros(chunk_size, dtype=np.float64)
+        self.jumlah_tangan = np.zeros(chunk_size, dtype=np.uint8)
+        self.landmarks = np.zeros((chunk_size, MAX_TANGAN, JUMLAH_LANDMARK, 3), dtype=np.float16)
+        self.handedness = np.full((chunk_size, MAX_TANGAN), -1, dtype=np.int8)
+        self.modes = np.zeros(chunk_size, dtype=np.uint8)
+        self.index = 0
+        self.total_frames = 0
+
+    def add(self, hand_landmarks_list, handedness_list=None, mode="ALFABET", timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        i = self.index
+        n = min(len(hand_landmarks_list), MAX_TANGAN)
+
+        self.timestamps[i] = timestamp
+        self.jumlah_tangan[i] = n
+        self.modes[i] = MODE_KODE.get(mode, 0)
+        self.handedness[i] = -1
+        for h in range(n):
+            self.landmarks[i, h] = [[lm.x, lm.y, lm.z] for lm in hand_landmarks_list[h]]
+            if handedness_list is not None and h < len(handedness_list):
+                self.handedness[i, h] = HANDEDNESS_KODE.get(handedness_list[h], -1)
+
+        self.index += 1
+        self.total_frames += 1
+        if self.index == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.index == 0:
+            return
+        n = self.index
+        ada = np.arange(MAX_TANGAN) < self.jumlah_tangan[:n, None]
+        buffer = io.BytesIO()
+        for array in (self.timestamps[:n], self.jumlah_tangan[:n], self.modes[:n],
+                      self.handedness[:n][ada], self.landmarks[:n][ada]):
+            np.save(buffer, array, allow_pickle=False)
+        np.save(self.file, np.frombuffer(zlib.compress(buffer.getvalue()), dtype=np.uint8),
+                allow_pickle=False)
+        self.file.flush()
+        self.index = 0
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+        print(f"[REKAM] {self.total_frames} frame disimpan ke {self.path} "
+              f"({os.path.getsize(self.path) / 1024:.1f} KB)")
+
+def sesi_kosong():
+    return {
+        "timestamps": np.zeros(0, dtype=np.float64),
+        "jumlah_tangan": np.zeros(0, dtype=np.uint8),
+        "landmarks": np.zeros((0, MAX_TANGAN, JUMLAH_LANDMARK, 3), dtype=np.float16),
+        "handedness": np.zeros((0, MAX_TANGAN), dtype=np.int8),
+        "modes": np.zeros(0, dtype=np.uint8),
+    }
+
+def baca_chunk(f):
+    """Satu chunk terkompresi; tangan yang terlihat dikembalikan ke slot per frame"""
+    buffer = io.BytesIO(zlib.decompress(np.load(f, allow_pickle=False).tobytes()))
+    timestamps, jumlah_tangan, modes, handedness, landmarks = (
+        np.load(buffer, allow_pickle=False) for _ in range(5))
+
+    n = len(timestamps)
+    ada = np.arange(MAX_TANGAN) < jumlah_tangan[:, None]
+    chunk = {
+        "timestamps": timestamps,
+        "jumlah_tangan": jumlah_tangan,
+        "landmarks": np.zeros((n, MAX_TANGAN, JUMLAH_LANDMARK, 3), dtype=np.float16),
+        "handedness": np.full((n, MAX_TANGAN), -1, dtype=np.int8),
+        "modes": modes,
+    }
+    chunk["landmarks"][ada] = landmarks
+    chunk["handedness"][ada] = handedness
+    return chunk
+
+def load_session(path):
+    """Baca seluruh sesi; kembalikan dict berisi array yang sudah digabung"""
+    chunks = {key: [] for key in sesi_kosong()}
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        magic = f.read(len(MAGIC))
+        if magic not in (MAGIC, MAGIC_V1):
+            raise ValueError(f"{path} bukan file sesi landmark")
+        while f.tell() < size:
+            if magic == MAGIC:
+                for key, array in baca_chunk(f).items():
+                    chunks[key].append(array)
+            else:
+                # Format lama: lima array tanpa kompresi per chunk
+                for key in ("timestamps", "jumlah_tangan", "landmarks", "handedness", "modes"):
+                    chunks[key].append(np.load(f, allow_pickle=False))
+
+    if not chunks["timestamps"]:
+        return sesi_kosong()
+    return {key: np.concatenate(value) for key, value in chunks.items()}
+
+def frame_ke_landmarks(landmarks, jumlah_tangan):
+    """Ubah array (tangan, 21, 3) menjadi list landmark seperti keluaran MediaPipe"""
+    return [[Titik(*p) for p in landmarks[h].tolist()] for h in range(jumlah_tangan)]
+
+def frame_ke_handedness(handedness, jumlah_tangan):
+    return [KODE_HANDEDNESS.get(int(kode)) for kode in handedness[:jumlah_tangan]]
+
+class TanganSesi:
+    """Landmark satu tangan dari sesi; Titik dibuat hanya untuk indeks yang dibaca"""
+    __slots__ = ("titik",)
+
+    def __init__(self, titik):
+        self.titik = titik
+
+    def __getitem__(self, i):
+        return Titik(*self.titik[i].tolist())
+
+    def __len__(self):
+        return len(self.titik)
+
+def fitur_sesi(sesi, translator):
+    """Fitur semua tangan dalam sesi, dihitung dalam satu panggilan hitung_fitur.
+
+    Mengembalikan list `tangan` per frame (seperti ekstrak_fitur) yang siap
+    diberikan ke translator.proses_fitur.
+    """
+    from bisindo_translator import hitung_fitur, fitur_per_tangan
+
+    # Kombinasi handedness per frame hanya sedikit; label_tangan cukup sekali per kombinasi
+    label_kode = {}
+    labels = []
+    for n, kode in zip(sesi["jumlah_tangan"].tolist(), sesi["handedness"].tolist()):
+        kunci = tuple(kode[:n])
+        if kunci not in label_kode:
+            label_kode[kunci] = translator.label_tangan([KODE_HANDEDNESS.get(k) for k in kunci], n)
+        labels.append(label_kode[kunci])
+
+    ada = np.arange(MAX_TANGAN) < sesi["jumlah_tangan"][:, None]
+    titik = sesi["landmarks"][ada].astype(np.float64)
+    kanan = np.array([label == "Right" for frame in labels for label in frame], dtype=bool)
+    fitur = fitur_per_tangan(hitung_fitur(titik, kanan)) if len(titik) else []
+
+    hasil = []
+    h = 0
+    for frame in labels:
+        hasil.append([(label, TanganSesi(titik[h + j]), fitur[h + j])
+                      for j, label in enumerate(frame)])
+        h += len(frame)
+    return hasil
+
+def pasang_jam_simulasi(translator):
+    """Ganti jam dan speak translator dengan versi simulasi.
+
+    Mengembalikan (jam, ucapan): dict berisi waktu simulasi 't' yang diatur
+    pemanggil, dan list (timestamp, teks) yang diisi speak dengan cooldown
+    yang sama, tanpa suara.
+    """
+    jam = {"t": 0.0}
+    ucapan = []
+    translator.clock = lambda: jam["t"]
+
+    def speak(text):
+        if jam["t"] - translator.last_speak_time > translator.speak_cooldown:
+            translator.last_speak_time = jam["t"]
+            ucapan.append((jam["t"], text))
+
+    translator.speak = speak
+    return jam, ucapan
+
+def replay_session(sesi, translator=None):
+    """Putar ulang sesi melalui proses_fitur dengan jam simulasi.
+
+    `sesi` adalah hasil load_session. Fitur seluruh sesi dihitung sekaligus
+    dengan fitur_sesi. Mengembalikan list (timestamp, gesture) untuk setiap
+    perubahan gesture dan list (timestamp, teks) untuk setiap ucapan.
+    """
+    if translator is None:
+        from bisindo_translator import BISINDOTranslator
+        translator = BISINDOTranslator()
+
+    jam, ucapan = pasang_jam_simulasi(translator)
+
+    perubahan = []
+    gesture_terakhir = translator.current_gesture
+    timestamps = sesi["timestamps"].tolist()
+    modes = sesi["modes"].tolist()
+    for t, kode_mode, tangan in zip(timestamps, modes, fitur_sesi(sesi, translator)):
+        jam["t"] = t
+        translator.mode = KODE_MODE.get(kode_mode, "ALFABET")
+        gesture = translator.proses_fitur(tangan)
+        if gesture != gesture_terakhir:
+            perubahan.append((t, gesture))
+            gesture_terakhir = gesture
+
+    return perubahan, ucapan
+
+def main():
+    parser = argparse.ArgumentParser(description="Putar ulang sesi landmark BISINDO")
+    parser.add_argument("path", help="File sesi hasil --record")
+    args = parser.parse_args()
+
+    sesi = load_session(args.path)
+    durasi = 0.0
+    if len(sesi["timestamps"]) > 1:
+        durasi = float(sesi["timestamps"][-1] - sesi["timestamps"][0])
+
+    mulai = time.perf_counter()
+    perubahan, ucapan = replay_session(sesi)
+    lama = time.perf_counter() - mulai
+
+    t0 = float(sesi["timestamps"][0]) if len(sesi["timestamps"]) else 0.0
+    for t, gesture in perubahan:
+        print(f"{t - t0:8.2f}s  {gesture}")
+    print(f"Ucapan: {' '.join(text for _, text in ucapan)}")
+    print(f"{len(sesi['timestamps'])} frame, durasi sesi {durasi:.1f}s, "
+          f"replay {lama:.3f}s ({durasi / max(lama, 1e-9):.0f}x real time)")
+
+if __name__ == "__main__":
+    main()
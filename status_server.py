@@ -0,0 +1,213 @@
+import asyncio
+import json
+import threading
+import time
+
+import cv2
+
+BOUNDARY = "frame"
+
+class FrameStats:
+    """Penghitung instrumentasi sederhana untuk loop deteksi"""
+    def __init__(self):
+        self.start_time = time.time()
+        self.frames = 0
+        self.fps = 0.0
+        self.last_frame_time = None
+        self.counters = {}
+
+    def tick(self):
+        current_time = time.time()
+        if self.last_frame_time is not None:
+            dt = current_time - self.last_frame_time
+            if dt > 0:
+                self.fps = 0.9 * self.fps + 0.1 * (1.0 / dt) if self.fps else 1.0 / dt
+        self.last_frame_time = current_time
+        self.frames += 1
+
+    def increment(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self):
+        return {
+            'frames': self.frames,
+            'fps': round(self.fps, 2),
+            'uptime': round(time.time() - self.start_time, 1),
+            **self.counters
+        }
+
+class StatusServer:
+    """Server HTTP asyncio di localhost untuk status JSON dan preview MJPEG.
+
+    Frame hanya di-encode ke JPEG selama ada klien preview yang terhubung.
+    """
+    def __init__(self, status_fn, host="127.0.0.1", port=8080,
+                 jpeg_quality=70, max_fps=15):
+        self.status_fn = status_fn
+        self.host = host
+        self.port = port
+        self.jpeg_quality = jpeg_quality
+        self.max_fps = max_fps
+
+        self.viewers = 0
+        self.frame_lock = threading.Lock()
+        self.latest_frame = None
+        self.frame_id = 0
+        self.encoded_id = -1
+        self.encoded_jpeg = None
+
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.error = None
+
+    def has_viewers(self):
+        return self.viewers > 0
+
+    def publish_frame(self, frame):
+        """Serahkan frame terbaru; diabaikan jika tidak ada penonton"""
+        if self.viewers == 0:
+            return
+        with self.frame_lock:
+            self.latest_frame = frame
+            self.frame_id += 1
+
+    def start(self):
+        """Jalankan server; kembalikan False jika port tidak dapat dipakai"""
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self.thread.start()
+        if not ready.wait(timeout=5):
+            self.error = "server tidak siap dalam 5 detik"
+        if self.error is not None:
+            print(f"✗ Server status gagal dijalankan di {self.host}:{self.port}: {self.error}")
+            return False
+        print(f"✓ Server status berjalan di http://{self.host}:{self.port}/")
+        return True
+
+    def stop(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+
+    def _run(self, ready):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.host, self.port)
+            )
+        except OSError as e:
+            self.error = e
+            self.loop.close()
+            self.loop = None
+            ready.set()
+            return
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.server.close()
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    async def _handle_client(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            while True:
+                line = await reader.readline()
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET":
+                await self._send(writer, 405, "text/plain", b"Method Not Allowed")
+                return
+
+            path = parts[1].split("?")[0]
+            if path in ("/", "/status"):
+                body = json.dumps(self.status_fn(), default=str).encode("utf-8")
+                await self._send(writer, 200, "application/json", body)
+            elif path == "/preview.mjpg":
+                await self._stream_mjpeg(reader, writer)
+            else:
+                await self._send(writer, 404, "text/plain", b"Not Found")
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        except Exception as e:
+            print(f"[ERROR SERVER] {e}")
+            try:
+                await self._send(writer, 500, "text/plain", b"Internal Server Error")
+            except ConnectionError:
+                pass
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _send(self, writer, code, content_type, body):
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed",
+                  500: "Internal Server Error"}[code]
+        header = (
+            f"HTTP/1.1 {code} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(header.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _stream_mjpeg(self, reader, writer):
+        writer.write((
+            "HTTP/1.1 200 OK\r\n"
+            f"Content-Type: multipart/x-mixed-replace; boundary={BOUNDARY}\r\n"
+            "Cache-Control: no-cache\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("latin-1"))
+        await writer.drain()
+
+        self.viewers += 1
+        last_sent = -1
+        try:
+            while True:
+                await asyncio.sleep(1.0 / self.max_fps)
+                if reader.at_eof() or writer.is_closing():
+                    break
+                jpeg, jpeg_id = await self._get_jpeg()
+                if jpeg is None or jpeg_id == last_sent:
+                    continue
+                last_sent = jpeg_id
+                writer.write(
+                    f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode("latin-1")
+                    + jpeg + b"\r\n"
+                )
+                await writer.drain()
+        finally:
+            self.viewers -= 1
+            if self.viewers == 0:
+                with self.frame_lock:
+                    self.latest_frame = None
+
+    async def _get_jpeg(self):
+        """Encode frame terbaru sekali saja, dipakai bersama oleh semua klien"""
+        with self.frame_lock:
+            frame = self.latest_frame
+            frame_id = self.frame_id
+        if frame is None:
+            return None, -1
+        if frame_id != self.encoded_id:
+            success, buffer = await self.loop.run_in_executor(
+                None, cv2.imencode, ".jpg", frame,
+                [int(cv2.IMWRITE_JPEG_QUALITY), self.jpeg_quality]
+            )
+            if success:
+                self.encoded_jpeg = buffer.tobytes()
+                self.encoded_id = frame_id
+        return self.encoded_jpeg, self.encoded_id
@@ -0,0 +1,354 @@
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Ruang parameter untuk SimpleSeatMonitor
+RUANG_MONITOR = {
+    'motion_threshold': [250, 500, 1000, 2000, 4000],
+    'stability_frames': [3, 5, 10, 15, 20],
+    'warning_delay': [2, 3, 5, 8],
+}
+
+# Ruang parameter untuk BISINDOTranslator; ambang alfabet diskalakan dari nilai default.
+# speak_cooldown tidak di-sweep: ia hanya mengubah jumlah ucapan, bukan tujuan pareto().
+RUANG_TRANSLATOR = {
+    'stability_threshold': [3, 4, 6, 8, 10, 12],
+}
+SKALA_AMBANG = [0.5, 0.75, 1.0, 1.25, 1.5]
+
+# Rentang bermakna untuk ambang; nilai hasil skala dipotong ke rentang ini
+BATAS_AMBANG = {
+    'sudut_telunjuk_x': (0, 180),
+}
+
+# Kejadian lain yang boleh muncul di dalam segmen tanpa dihitung alarm palsu.
+# Monitor: segmen PERINGATAN menandai rentang saat peringatan seharusnya
+# berbunyi (kosong cukup lama); transisi KOSONG di dalamnya tetap wajar.
+DITOLERANSI = {
+    'translator': {},
+    'monitor': {'PERINGATAN': {'KOSONG'}},
+}
+
+BATAS_GRID = 100000
+
+_APP = None
+_FITUR = None
+
+def ruang_parameter(app):
+    if app == 'monitor':
+        return dict(RUANG_MONITOR)
+    from bisindo_translator import AMBANG_DEFAULT
+    ruang = dict(RUANG_TRANSLATOR)
+    for key, nilai in AMBANG_DEFAULT.items():
+        bawah, atas = BATAS_AMBANG.get(key, (0, float('inf')))
+        ruang[f'ambang.{key}'] = sorted({min(max(round(nilai * s, 4), bawah), atas)
+                                         for s in SKALA_AMBANG})
+    return ruang
+
+def angka(nama, teks):
+    try:
+        return int(teks)
+    except ValueError:
+        pass
+    try:
+        return float(teks)
+    except ValueError:
+        raise SystemExit(f"Nilai tidak valid untuk {nama}: {teks!r}")
+
+def pilih_parameter(app, params):
+    """Batasi ruang ke parameter pilihan; `params` berisi 'NAMA' atau 'NAMA=v1,v2'.
+
+    Parameter yang tidak dipilih tetap bernilai default.
+    """
+    ruang = ruang_parameter(app)
+    if not params:
+        return ruang
+
+    terpilih = {}
+    for param in params:
+        nama, _, nilai = param.partition('=')
+        if nama not in ruang:
+            raise SystemExit(f"Parameter tidak dikenal: {nama}. Pilihan: {', '.join(ruang)}")
+        if nilai:
+            terpilih[nama] = [angka(nama, v) for v in nilai.split(',')]
+        else:
+            terpilih[nama] = ruang[nama]
+    return terpilih
+
+def config_default(app):
+    if app == 'monitor':
+        from deteksi_aktivitas import SimpleSeatMonitor
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            obj = SimpleSeatMonitor(log_file=None, rekam_klip=False)
+    else:
+        from bisindo_translator import BISINDOTranslator
+        obj = BISINDOTranslator()
+
+    config = {}
+    for key in ruang_parameter(app):
+        if key.startswith('ambang.'):
+            config[key] = obj.ambang[key[len('ambang.'):]]
+        else:
+            config[key] = getattr(obj, key)
+    return config
+
+def buat_kandidat(app, mode, jumlah, seed, params=None):
+    ruang = pilih_parameter(app, params)
+    keys = list(ruang)
+    default = config_default(app)
+    kandidat = [default]
+
+    if mode == 'grid':
+        ukuran = int(np.prod([len(ruang[k]) for k in keys]))
+        if ukuran > BATAS_GRID:
+            raise SystemExit(f"Grid berisi {ukuran} kombinasi; pilih parameter dengan "
+                             f"--param atau gunakan --mode random")
+        for nilai in itertools.product(*(ruang[k] for k in keys)):
+            kandidat.append({**default, **dict(zip(keys, nilai))})
+    else:
+        rng = random.Random(seed)
+        for _ in range(jumlah):
+            kandidat.append({**default, **{k: rng.choice(ruang[k]) for k in keys}})
+
+    unik = {}
+    for config in kandidat:
+        unik.setdefault(tuple(sorted(config.items())), config)
+    return list(unik.values())
+
+def path_label(path):
+    return os.path.splitext(path)[0] + '.json'
+
+def muat_label(path):
+    """Label rekaman: {"segmen": [{"mulai": s, "selesai": s, "label": str}, ...]}
+
+    Label monitor: ADA, KOSONG, dan PERINGATAN untuk rentang kosong saat
+    peringatan seharusnya sudah berbunyi. Kejadian di luar semua segmen
+    dihitung sebagai alarm palsu.
+    """
+    with open(path_label(path), 'r') as f:
+        return json.load(f)['segmen']
+
+def fitur_translator(path):
+    """Fitur semua tangan per frame (fitur_sesi); tidak bergantung parameter.
+
+    Waktu dihitung dari awal rekaman agar cocok dengan segmen label.
+    """
+    from bisindo_translator import BISINDOTranslator
+    from sesi_landmark import load_session, fitur_sesi, KODE_MODE
+
+    sesi = load_session(path)
+    timestamps = sesi['timestamps'].tolist()
+    t0 = timestamps[0] if timestamps else 0.0
+    modes = sesi['modes'].tolist()
+    return [(t - t0, KODE_MODE.get(kode, "ALFABET"), tangan)
+            for t, kode, tangan in zip(timestamps, modes, fitur_sesi(sesi, BISINDOTranslator()))]
+
+def fitur_monitor(path):
+    """Jumlah piksel gerak per frame dari video; di-cache ke <video>.motion.npz"""
+    cache = path + '.motion.npz'
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+        data = np.load(cache)
+        return data['timestamps'], data['motion']
+
+    import cv2
+    from deteksi_aktivitas import SimpleSeatMonitor
+
+    cap = cv2.VideoCapture(path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        monitor = SimpleSeatMonitor(log_file=None, rekam_klip=False)
+
+    motion = []
+    while True:
+        success, frame = cap.read()
+        if not success:
+            break
+        _, motion_pixels, _ = monitor.detect_motion_simple(frame)
+        motion.append(motion_pixels)
+    cap.release()
+
+    motion = np.array(motion, dtype=np.int32)
+    timestamps = np.arange(len(motion), dtype=np.float64) / fps
+    np.savez(cache, timestamps=timestamps, motion=motion)
+    return timestamps, motion
+
+def simulasi_translator(config, fitur):
+    from bisindo_translator import BISINDOTranslator
+    from sesi_landmark import pasang_jam_simulasi
+
+    translator = BISINDOTranslator()
+    for key, nilai in config.items():
+        if key.startswith('ambang.'):
+            translator.ambang[key[len('ambang.'):]] = nilai
+        else:
+            setattr(translator, key, nilai)
+    jam, ucapan = pasang_jam_simulasi(translator)
+    # Waktu mulai dari 0; tanpa ini ucapan di awal rekaman tertahan cooldown,
+    # tidak seperti saat live atau replay_session yang memakai waktu absolut
+    translator.last_speak_time = float('-inf')
+
+    kejadian = []
+    for t, mode, tangan in fitur:
+        jam['t'] = t
+        translator.mode = mode
+        sebelum = translator.current_gesture
+        gesture = translator.proses_fitur(tangan)
+        if gesture != sebelum and gesture != "Tidak Dikenal":
+            kejadian.append((t, gesture))
+    return kejadian, len(ucapan)
+
+def simulasi_monitor(config, fitur):
+    from deteksi_aktivitas import SimpleSeatMonitor
+
+    timestamps, motion = fitur
+    monitor = SimpleSeatMonitor(log_file=None, rekam_klip=False)
+    for key, nilai in config.items():
+        setattr(monitor, key, nilai)
+    jam = {'t': 0.0}
+    monitor.clock = lambda: jam['t']
+    monitor.session_start = 0.0
+    ucapan = []
+    monitor.speak_async = ucapan.append
+
+    kejadian = []
+    for t, motion_pixels in zip(timestamps.tolist(), motion.tolist()):
+        jam['t'] = t
+        hadir = monitor.is_person_present
+        peringatan = monitor.last_warning_time
+        monitor.update_presence(motion_pixels > monitor.motion_threshold, motion_pixels)
+        if monitor.is_person_present != hadir:
+            kejadian.append((t, "ADA" if monitor.is_person_present else "KOSONG"))
+        if monitor.last_warning_time != peringatan:
+            kejadian.append((t, "PERINGATAN"))
+    return kejadian, len(ucapan)
+
+def nilai_kejadian(kejadian, segmen, ditoleransi):
+    """Bandingkan kejadian hasil simulasi dengan segmen berlabel"""
+    hasil = {'segmen': len(segmen), 'terdeteksi': 0, 'waktu_deteksi': 0.0, 'alarm_palsu': 0}
+    for seg in segmen:
+        cocok = [t for t, label in kejadian
+                 if seg['mulai'] <= t <= seg['selesai'] and label == seg['label']]
+        if cocok:
+            hasil['terdeteksi'] += 1
+            hasil['waktu_deteksi'] += cocok[0] - seg['mulai']
+
+    for t, label in kejadian:
+        aktif = [seg for seg in segmen if seg['mulai'] <= t <= seg['selesai']]
+        if not any(label == seg['label'] or label in ditoleransi.get(seg['label'], ())
+                   for seg in aktif):
+            hasil['alarm_palsu'] += 1
+    return hasil
+
+def _init_worker(app, fitur):
+    global _APP, _FITUR
+    _APP = app
+    _FITUR = fitur
+
+def evaluasi(config):
+    """Jalankan logika keputusan untuk satu config pada semua rekaman ter-cache"""
+    simulasi = simulasi_monitor if _APP == 'monitor' else simulasi_translator
+    total = {'segmen': 0, 'terdeteksi': 0, 'waktu_deteksi': 0.0, 'alarm_palsu': 0, 'ucapan': 0}
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for fitur, segmen in _FITUR:
+            kejadian, jumlah_ucapan = simulasi(config, fitur)
+            hasil = nilai_kejadian(kejadian, segmen, DITOLERANSI[_APP])
+            for key, nilai in hasil.items():
+                total[key] += nilai
+            total['ucapan'] += jumlah_ucapan
+
+    return {
+        'config': config,
+        'akurasi': total['terdeteksi'] / max(total['segmen'], 1),
+        'waktu_deteksi': (total['waktu_deteksi'] / total['terdeteksi']
+                          if total['terdeteksi'] else float('inf')),
+        'alarm_palsu': total['alarm_palsu'],
+        'ucapan': total['ucapan'],
+    }
+
+def pareto(hasil):
+    """Ambil hasil yang tidak didominasi: akurasi maks, waktu deteksi dan alarm palsu min"""
+    def mendominasi(a, b):
+        lebih_baik_semua = (a['akurasi'] >= b['akurasi'] and
+                            a['waktu_deteksi'] <= b['waktu_deteksi'] and
+                            a['alarm_palsu'] <= b['alarm_palsu'])
+        lebih_baik_satu = (a['akurasi'] > b['akurasi'] or
+                           a['waktu_deteksi'] < b['waktu_deteksi'] or
+                           a['alarm_palsu'] < b['alarm_palsu'])
+        return lebih_baik_semua and lebih_baik_satu
+
+    depan = [h for h in hasil if not any(mendominasi(lain, h) for lain in hasil)]
+    depan.sort(key=lambda h: (-h['akurasi'], h['alarm_palsu'], h['waktu_deteksi']))
+    return depan
+
+def config_siap_pakai(config):
+    """Ubah config datar menjadi format yang dibaca muat_config"""
+    hasil = {}
+    for key, nilai in config.items():
+        if key.startswith('ambang.'):
+            hasil.setdefault('ambang', {})[key[len('ambang.'):]] = nilai
+        else:
+            hasil[key] = nilai
+    return hasil
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Tuning parameter stabilitas, waktu dan ambang")
+    parser.add_argument('app', choices=['translator', 'monitor'])
+    parser.add_argument('rekaman', nargs='+',
+                        help="File sesi .lmk (translator) atau video (monitor); "
+                             "label dibaca dari file .json bernama sama")
+    parser.add_argument('--mode', choices=['grid', 'random'], default='random')
+    parser.add_argument('--param', action='append', metavar='NAMA[=v1,v2]',
+                        help="Parameter yang di-sweep (boleh berulang); lainnya tetap default. "
+                             "Tanpa nilai memakai nilai bawaan ruang parameter")
+    parser.add_argument('--jumlah', type=int, default=200, help="Jumlah sampel untuk mode random")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', default=None, help="Prefix file laporan dan config")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    output = args.output or f"tuning_{args.app}"
+
+    mulai = time.perf_counter()
+    ekstrak = fitur_monitor if args.app == 'monitor' else fitur_translator
+    fitur = [(ekstrak(path), muat_label(path)) for path in args.rekaman]
+    print(f"Fitur {len(fitur)} rekaman siap dalam {time.perf_counter() - mulai:.1f}s")
+
+    kandidat = buat_kandidat(args.app, args.mode, args.jumlah, args.seed, args.param)
+    print(f"Mengevaluasi {len(kandidat)} config dengan {args.workers} proses...")
+
+    mulai = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.app, fitur)) as executor:
+        chunksize = max(1, len(kandidat) // (args.workers * 4))
+        hasil = list(executor.map(evaluasi, kandidat, chunksize=chunksize))
+    print(f"Selesai dalam {time.perf_counter() - mulai:.1f}s")
+
+    depan = pareto(hasil)
+    print("\nPARETO (akurasi / waktu deteksi / alarm palsu):")
+    for h in depan:
+        print(f"  {h['akurasi']:.3f}  {h['waktu_deteksi']:6.2f}s  {h['alarm_palsu']:4d}  {h['config']}")
+
+    baseline = hasil[0]
+    print(f"\nDefault: {baseline['akurasi']:.3f}  {baseline['waktu_deteksi']:.2f}s  "
+          f"{baseline['alarm_palsu']}")
+
+    with open(f"{output}_laporan.json", 'w') as f:
+        json.dump({'default': baseline, 'pareto': depan, 'semua': hasil}, f, indent=2)
+
+    terbaik = depan[0]
+    with open(f"{output}_config.json", 'w') as f:
+        json.dump(config_siap_pakai(terbaik['config']), f, indent=2)
+    print(f"Laporan: {output}_laporan.json, config: {output}_config.json (pakai dengan --config)")
+
+if __name__ == "__main__":
+    main()